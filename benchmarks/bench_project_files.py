@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scaling microbenchmarks for the project-file steps that run on every build.
+
+Each case is timed on generated fixtures of increasing size (config.xml with
+hundreds of plugins, AndroidManifest.xml with thousands of entries, a long
+app/build.gradle, a platforms/android tree with up to 100k files, bursts of
+translate() / Logger.log calls). Like pytest-benchmark, every size is run for
+several rounds (fixture reset outside the timed region) and the median is kept.
+
+For every case the script prints a scaling curve: time per size and the
+exponent k of time ~ size^k between consecutive sizes. k close to 1 is linear;
+k near 2 on the largest sizes means quadratic behaviour and fails the check
+(--max-exponent). Medians are also compared with the budgets stored in
+benchmarks/baselines/project_files.json: median * --slack, but at least
+--min-slack seconds above the median, so sub-millisecond cases do not fail on
+timer and scheduler noise.
+
+Cases:
+    splash_icon_config   MainApp._ensure_splash_icon_config   (plugins in config.xml)
+    manifest_permissions MainApp._fix_android_manifest_permissions (manifest entries)
+    legacy_gradle_patch  BuilderCore._undo_legacy_gradle_patch (build.gradle lines;
+                         replaces the old _configure_gradle_for_apk step)
+    find_artifacts       BuilderCore._find_artifacts_cordova  (files under platforms/android)
+    translate            translate() in en/ru/pt               (calls)
+    logger_log           Logger.log                            (calls)
+
+Usage:
+    python benchmarks/bench_project_files.py                 # check curves and budgets
+    python benchmarks/bench_project_files.py -k config       # only cases containing "config"
+    python benchmarks/bench_project_files.py --quick         # drop the largest size of each case
+    python benchmarks/bench_project_files.py --update        # store a new baseline
+
+Exit code is 1 when a case exceeds its budget or scales worse than --max-exponent.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "project_files.json")
+sys.path.insert(0, ROOT)
+
+
+# ------------------------
+# Fixtures
+# ------------------------
+def config_xml(plugins):
+    """config.xml экспорта Construct 3 с plugins плагинами; префиксы ns0: как после ElementTree."""
+    parts = [
+        "<?xml version='1.0' encoding='utf-8'?>",
+        '<widget xmlns="http://www.w3.org/ns/widgets" xmlns:ns0="http://schemas.android.com/apk/res/android" '
+        'id="com.example.game" version="1.0.0">',
+        "<name>game</name>",
+        '<content src="index.html" />',
+        '<icon src="www/icons/icon-512.png" />',
+        '<splash src="www/splash.png" />',
+    ]
+    for i in range(plugins):
+        parts.append(f'<plugin name="cordova-plugin-bench-{i}" spec="^{i % 9 + 1}.0.0">'
+                     f'<variable name="API_KEY_{i}" value="key{i}" /></plugin>')
+        parts.append(f'<preference name="BenchPref{i}" value="{i}" />')
+    parts.append('<platform name="android">')
+    parts.append('<splash density="port-hdpi" src="res/screen/android/splash-port-hdpi.png" />')
+    parts.append('<config-file parent="/manifest" target="AndroidManifest.xml">')
+    for i in range(max(1, plugins // 4)):
+        parts.append(f'<uses-permission ns0:name="android.permission.BENCH_{i}" />')
+    parts.append("</config-file>")
+    parts.append('<engine name="android" spec="10.1.2" />')
+    parts.append("</platform>")
+    parts.append("</widget>")
+    return "\n".join(parts) + "\n"
+
+
+def android_manifest(entries):
+    parts = ['<?xml version="1.0" encoding="utf-8"?>',
+             '<manifest xmlns:ns0="http://schemas.android.com/apk/res/android" package="com.example.game">']
+    for i in range(entries):
+        parts.append(f'    <uses-permission ns0:name="android.permission.BENCH_{i}" />')
+    parts.append('    <application ns0:label="@string/app_name">')
+    for i in range(entries // 4):
+        parts.append(f'        <activity ns0:name="com.example.Activity{i}" ns0:exported="false" />')
+    parts.append("    </application>")
+    parts.append("</manifest>")
+    return "\n".join(parts) + "\n"
+
+
+def build_gradle(lines):
+    """app/build.gradle с блоком bundle, закомментированным старыми версиями билдера, посередине."""
+    body = [f"    implementation 'com.example:lib{i}:1.0.{i % 10}'" for i in range(lines)]
+    half = len(body) // 2
+    bundle = ["// android {", "//     bundle {", "//         language { enableSplit = false }", "//     }", "// }"]
+    return "\n".join(["apply plugin: 'com.android.application'", "dependencies {"] + body[:half] + ["}"]
+                     + bundle + ["dependencies {"] + body[half:] + ["}"]) + "\n"
+
+
+def platform_tree(root, files):
+    """platforms/android с files промежуточными файлами Gradle и одним APK."""
+    android = os.path.join(root, "platforms", "android")
+    for i in range(files):
+        folder = os.path.join(android, "app", "build", "intermediates", f"task{i // 500:04d}", f"d{(i // 50) % 10}")
+        if i % 50 == 0:
+            os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"f{i:06d}.{('class', 'dex', 'xml', 'json')[i % 4]}"), "wb"):
+            pass
+    apk_dir = os.path.join(android, "app", "build", "outputs", "apk", "debug")
+    os.makedirs(apk_dir, exist_ok=True)
+    with open(os.path.join(apk_dir, "app-debug.apk"), "wb") as f:
+        f.write(b"PK\x05\x06" + b"\0" * 18)
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class Shim:
+    """Атрибуты, которые читают шаги обработки проекта (без Tk и без установки инструментов)."""
+    def __init__(self, main, logdir):
+        self.logger = main.StreamLogger(os.path.join(logdir, "bench.log"))
+        self.toolchain = main.TOOLCHAIN_MANIFEST["toolchains"]["default"]
+
+
+# ------------------------
+# Cases
+# ------------------------
+# Каждый case(main, shim, tmp, n) -> (reset, run): reset готовит фикстуру вне замера, run — замеряемый вызов.
+def case_splash_icon_config(main, shim, tmp, n):
+    proj = os.path.join(tmp, "proj")
+    text = config_xml(n)
+    return (lambda: write(os.path.join(proj, "config.xml"), text),
+            lambda: main.MainApp._ensure_splash_icon_config(shim, proj))
+
+
+def case_manifest_permissions(main, shim, tmp, n):
+    proj = os.path.join(tmp, "proj")
+    path = os.path.join(proj, "platforms", "android", "app", "src", "main", "AndroidManifest.xml")
+    text = android_manifest(n)
+    return (lambda: write(path, text),
+            lambda: main.MainApp._fix_android_manifest_permissions(shim, proj))
+
+
+def case_legacy_gradle_patch(main, shim, tmp, n):
+    proj = os.path.join(tmp, "proj")
+    path = os.path.join(proj, "platforms", "android", "app", "build.gradle")
+    text = build_gradle(n)
+    return (lambda: write(path, text),
+            lambda: main.BuilderCore._undo_legacy_gradle_patch(shim, proj))
+
+
+def case_find_artifacts(main, shim, tmp, n):
+    proj = os.path.join(tmp, "proj")
+    platform_tree(proj, n)  # дерево не меняется: строится один раз на размер
+    return (lambda: None,
+            lambda: main.BuilderCore._find_artifacts_cordova(shim, proj, "Debug APK"))
+
+
+def case_translate(main, shim, tmp, n):
+    templates = ["Downloading {description}... {percent}%", "Build completed", "Installing component: {comp}...",
+                 "Signing APK: {basename}...", "Unknown template {x}"]
+    langs = ("en", "ru", "pt")
+
+    def run():
+        translate = main.translate
+        for i in range(n):
+            translate(templates[i % len(templates)], langs[i % 3], description="Gradle", percent=i % 100,
+                      comp="platforms;android-34", basename="app-debug.apk", x=i)
+    return (lambda: None, run)
+
+
+def case_logger_log(main, shim, tmp, n):
+    logger = main.Logger(None, lambda: "ru")
+
+    def run():
+        # Без виджета Logger печатает в stdout — уводим в /dev/null, запись в файл лога остаётся
+        with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+            for i in range(n):
+                logger.log("Downloading {description}... {percent}%", "INFO", description="Gradle", percent=i % 100)
+
+    def reset():
+        with open(logger.logfile, "w", encoding="utf-8"):
+            pass
+    return (reset, run)
+
+
+CASES = [
+    ("splash_icon_config", case_splash_icon_config, (10, 100, 1000)),
+    ("manifest_permissions", case_manifest_permissions, (100, 1000, 10000)),
+    ("legacy_gradle_patch", case_legacy_gradle_patch, (1000, 10000, 100000)),
+    ("find_artifacts", case_find_artifacts, (1000, 10000, 100000)),
+    ("translate", case_translate, (1000, 10000, 100000)),
+    ("logger_log", case_logger_log, (1000, 10000, 100000)),
+]
+
+
+# ------------------------
+# Runner
+# ------------------------
+def measure(reset, run, min_rounds, max_rounds, min_time):
+    """Медиана по раундам; раунды идут, пока их меньше min_rounds или суммарно меньше min_time."""
+    samples = []
+    spent = 0.0
+    while len(samples) < max_rounds and (len(samples) < min_rounds or spent < min_time):
+        reset()
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+        spent += elapsed
+    return statistics.median(samples), len(samples)
+
+
+def exponent(n1, t1, n2, t2):
+    """k в t ~ n^k между двумя точками кривой."""
+    if t1 <= 0 or t2 <= 0 or n1 == n2:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-k", dest="select", default="", help="run only cases whose name contains this text")
+    ap.add_argument("--quick", action="store_true", help="skip the largest size of each case")
+    ap.add_argument("--min-rounds", type=int, default=3)
+    ap.add_argument("--max-rounds", type=int, default=25)
+    ap.add_argument("--min-time", type=float, default=0.3, help="seconds of timed work per size")
+    ap.add_argument("--max-exponent", type=float, default=1.5,
+                    help="fail when time grows faster than size^k between the two largest sizes")
+    ap.add_argument("--update", action="store_true", help="write the measured medians as the new baseline")
+    ap.add_argument("--slack", type=float, default=2.0, help="budget = median * slack when updating")
+    ap.add_argument("--min-slack", type=float, default=0.005, help="minimum budget headroom in seconds")
+    args = ap.parse_args()
+
+    work = tempfile.mkdtemp(prefix="saturn-bench-")
+    cwd = os.getcwd()
+    os.chdir(work)  # Logger создаёт ./logs в текущем каталоге
+    try:
+        import main as saturn
+        shim = Shim(saturn, os.path.join(work, "logs"))
+        results = {}
+        steep = []
+        for name, case, sizes in CASES:
+            if args.select not in name:
+                continue
+            if args.quick:
+                sizes = sizes[:-1]
+            print(f"{name}:")
+            curve = []
+            for n in sizes:
+                tmp = os.path.join(work, f"{name}-{n}")
+                os.makedirs(tmp)
+                reset, run = case(saturn, shim, tmp, n)
+                median, rounds = measure(reset, run, args.min_rounds, args.max_rounds, args.min_time)
+                shutil.rmtree(tmp, ignore_errors=True)
+                k = exponent(curve[-1][0], curve[-1][1], n, median) if curve else None
+                curve.append((n, median))
+                print(f"  n={n:<8} {median * 1000:10.3f} ms  {median / n * 1e6:9.3f} us/item  "
+                      f"{'k=%.2f' % k if k is not None else '':>7}  ({rounds} rounds)", flush=True)
+                results[f"{name}[{n}]"] = median
+            if len(curve) >= 2:
+                k = exponent(*curve[-2], *curve[-1])
+                if k is not None and k > args.max_exponent:
+                    steep.append((name, k))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+
+    for name, k in steep:
+        print(f"FAIL: {name} scales as n^{k:.2f} on the largest sizes (limit {args.max_exponent})")
+
+    if args.update:
+        os.makedirs(os.path.dirname(BASELINE), exist_ok=True)
+        data = {"python": platform.python_version(), "platform": platform.system(), "cases": {}}
+        if os.path.exists(BASELINE):
+            with open(BASELINE, "r", encoding="utf-8") as f:
+                data["cases"] = json.load(f).get("cases", {})
+        for key, median in results.items():
+            budget = max(median * args.slack, median + args.min_slack)
+            data["cases"][key] = {"median_us": int(median * 1e6), "budget_us": int(budget * 1e6)}
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=False)
+            f.write("\n")
+        print(f"baseline written: {BASELINE}")
+        return 1 if steep else 0
+
+    if not os.path.exists(BASELINE):
+        print("no baseline yet; run with --update")
+        return 1 if steep else 0
+    with open(BASELINE, "r", encoding="utf-8") as f:
+        budgets = json.load(f)["cases"]
+    over = [key for key, median in results.items() if key in budgets and median * 1e6 > budgets[key]["budget_us"]]
+    for key in over:
+        print(f"OVER BUDGET: {key} {results[key] * 1000:.3f} ms > {budgets[key]['budget_us'] / 1000:.3f} ms")
+    ok = not over and not steep
+    print("budget -> " + ("OK" if ok else "FAIL"))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
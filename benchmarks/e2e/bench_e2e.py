@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline end-to-end benchmark for Saturn Builder (Linux).
+
+Runs the real builder code (HeadlessBuilder from main.py) against a stub
+toolchain: node, npm, cordova, gradle/gradlew, sdkmanager, zipalign, apksigner,
+java and keytool are small Python scripts (stub_tool.py) that print realistic
+output and write dummy artifacts. Toolchain archives are served from a local
+HTTP server, projects are generated Construct 3 style ZIPs, nothing touches the
+network.
+
+Every stub records its own lifetime, so for each phase
+
+    overhead = wall time - time spent inside stub processes
+
+is what Saturn Builder itself costs: extraction, process plumbing, logging,
+file scans, patching. Phases (per project size where it matters):
+
+    install          download + extract + sdkmanager + npm install of the toolchain
+    import           _load_cordova_zip of the generated project ZIP
+    build_full       first Debug APK build (platform add + cordova build)
+    build_www_patch  Debug APK rebuild after one www/ file changed (APK repackaging)
+    log_throughput   _run_and_stream of a process printing --log-lines lines
+    artifact_scan    _find_artifacts_cordova over a --tree-files file platform tree
+    sign             _sign_and_align of an unsigned release APK
+
+Module import time is covered by benchmarks/startup_importtime.py.
+
+Usage:
+    python benchmarks/e2e/bench_e2e.py                      # 1M and 16M projects, check budget
+    python benchmarks/e2e/bench_e2e.py --sizes 1M,256M,2G   # up to the 2 GB case
+    python benchmarks/e2e/bench_e2e.py --update             # store a new baseline
+
+Exit code is 1 when a phase's overhead exceeds its budget in
+benchmarks/baselines/e2e.json (phases missing from the baseline are only reported).
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+BASELINE = os.path.join(os.path.dirname(HERE), "baselines", "e2e.json")
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+import stub_tool  # noqa: E402
+import toolchain  # noqa: E402
+
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text):
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+class StubClock:
+    """Сумма времени, проведённого в процессах-заглушках (из файла SATURN_STUB_TIMES)."""
+    def __init__(self, path):
+        self.path = path
+        open(path, "w").close()
+
+    def take(self):
+        total, calls = 0.0, 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2:
+                        total += float(parts[1])
+                        calls += 1
+        except OSError:
+            pass
+        open(self.path, "w").close()
+        return total, calls
+
+
+class ImportShim:
+    """Минимум MainApp, который нужен _load_cordova_zip (без Tk)."""
+    class _Var:
+        def set(self, value):
+            self.value = value
+
+    class _Button:
+        def configure(self, **kwargs):
+            pass
+
+    def __init__(self, builder):
+        self.logger = builder.logger
+        self.PROJ_DIR = builder.PROJ_DIR
+        self._set_progress = builder._set_progress
+        self._tr = builder._tr
+        self.project_info_var = self._Var()
+        self.btn_build = self._Button()
+        self.project_path = None
+        self.project_loaded = False
+
+
+class Bench:
+    def __init__(self, args, work):
+        self.args = args
+        self.work = work
+        self.results = {}
+        self.clock = StubClock(os.path.join(work, "stub-times.txt"))
+
+    def phase(self, name, fn, runs=1, **extra):
+        """Замеряет fn: медиана по runs прогонам; overhead = wall - время в заглушках."""
+        walls, stubs, calls = [], [], 0
+        for _ in range(runs):
+            self.clock.take()
+            started = time.perf_counter()
+            out = fn()
+            walls.append(time.perf_counter() - started)
+            stub, n = self.clock.take()
+            stubs.append(stub)
+            calls = n
+        wall, stub = statistics.median(walls), statistics.median(stubs)
+        result = {"wall_s": round(wall, 4), "stub_s": round(stub, 4),
+                  "overhead_s": round(max(0.0, wall - stub), 4), "stub_calls": calls}
+        for key, value in extra.items():
+            result[key] = value(wall) if callable(value) else value
+        self.results[name] = result
+        line = f"  {name:<28} wall {wall:8.3f}s  stub {stub:8.3f}s  overhead {result['overhead_s']:8.3f}s"
+        rates = [f"{k} {v}" for k, v in result.items() if k.endswith("_per_s")]
+        print(line + ("  " + ", ".join(rates) if rates else ""), flush=True)
+        return out
+
+
+def run(args):
+    import main
+    work = tempfile.mkdtemp(prefix="saturn-e2e-")
+    cwd = os.getcwd()
+    try:
+        base = os.path.join(work, "base")
+        os.makedirs(base)
+        os.chdir(base)  # Logger пишет ./logs в текущий каталог
+        bench = Bench(args, work)
+        # Окружение сборок копирует os.environ: переменные заглушек и debug-ключ задаём до первого _get_env
+        os.environ["SATURN_STUB_TIMES"] = bench.clock.path
+        os.environ["SATURN_STUB_LINES"] = str(args.gradle_lines)
+        android_home = os.path.join(work, "android-user-home")
+        os.makedirs(android_home)
+        with open(os.path.join(android_home, "debug.keystore"), "wb") as f:
+            f.write(os.urandom(2048))
+        os.environ["ANDROID_USER_HOME"] = android_home
+
+        versions = main.TOOLCHAIN_MANIFEST["toolchains"]["default"]
+        archives = os.path.join(work, "archives")
+        names = toolchain.build_archives(archives, versions, padding_mb=args.toolchain_mb)
+        with toolchain.ArchiveServer(archives) as server:
+            toolchain.write_manifest(os.path.join(base, "dependencies"), server.url, names)
+            builder = main.HeadlessBuilder(base=base)
+            builder.logger = main.StreamLogger(os.path.join(work, "logs", "bench.log"))
+            print(f"toolchain archives: {sum(os.path.getsize(os.path.join(archives, n)) for n in names.values()) / 2**20:.1f} MB "
+                  f"from {server.url}")
+            bench.phase("install", lambda: builder._get_env(builder._activate_toolchain(None)))
+        missing = builder._missing_dependencies(log=True)
+        if missing:
+            raise RuntimeError(f"stub toolchain incomplete: {', '.join(missing)}\n" + "".join(builder.logger.lines[-40:]))
+
+        for label in args.sizes:
+            size = parse_size(label)
+            print(f"project {label}:", flush=True)
+            zip_path = os.path.join(work, f"c3-{label}.zip")
+            toolchain.make_c3_project_zip(zip_path, size)
+            shim = ImportShim(builder)
+            bench.phase(f"import[{label}]", lambda: main.MainApp._load_cordova_zip(shim, zip_path),
+                        mb_per_s=lambda wall: round(size / 2**20 / wall, 1))
+            project = shim.project_path
+            if not shim.project_loaded:
+                raise RuntimeError(f"import failed for {zip_path}")
+
+            def build():
+                ctx = builder.run_build(project, "Debug APK", "Cordova")
+                if not ctx.artifacts:
+                    raise RuntimeError("build produced no artifacts\n" + "".join(builder.logger.lines[-40:]))
+                return ctx
+            bench.phase(f"build_full[{label}]", build)
+            with open(os.path.join(project, "www", "index.html"), "a", encoding="utf-8") as f:
+                f.write("<!-- edit -->\n")
+            bench.phase(f"build_www_patch[{label}]", build)
+            shutil.rmtree(project, ignore_errors=True)
+            os.remove(zip_path)
+
+        print("pipeline:", flush=True)
+        emit = os.path.join(work, "bin", "emit")
+        stub_tool.write_launcher(emit, "emit")
+        lines = args.log_lines
+        bench.phase("log_throughput", lambda: builder._run_and_stream([emit, str(lines)]), runs=args.runs,
+                    lines_per_s=lambda wall: int(lines / wall))
+
+        tree = os.path.join(work, "tree")
+        make_platform_tree(tree, args.tree_files)
+        bench.phase("artifact_scan", lambda: builder._find_artifacts_cordova(tree, "Debug APK"), runs=args.runs,
+                    files_per_s=lambda wall: int(args.tree_files / wall))
+
+        android_dir = os.path.join(tree, "platforms", "android")
+        unsigned = stub_tool.write_outputs(android_dir, "release")
+        keystore = os.path.join(work, "release.keystore")
+        with open(keystore, "wb") as f:
+            f.write(os.urandom(2048))
+        ctx = main.BuildContext(tree, "Signed Release APK", "Cordova", env=builder._get_env(),
+                                toolchain=builder.toolchain)
+        ctx.set_keystore(keystore, "release", "android")
+        pristine = unsigned + ".orig"
+        shutil.copyfile(unsigned, pristine)
+
+        def sign():
+            shutil.copyfile(pristine, unsigned)
+            if not builder._sign_and_align(ctx, [unsigned]):
+                raise RuntimeError("signing failed\n" + "".join(builder.logger.lines[-20:]))
+        bench.phase("sign", sign, runs=args.runs)
+        return bench.results
+    finally:
+        os.chdir(cwd)
+        if args.keep:
+            print(f"work dir kept: {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+def make_platform_tree(root, count):
+    """Дерево platforms/android, похожее на результат Gradle: много промежуточных файлов и один APK."""
+    android = os.path.join(root, "platforms", "android")
+    per_dir = 200
+    for i in range(count):
+        folder = os.path.join(android, "app", "build", "intermediates", f"task{i // per_dir:04d}", f"d{(i // 20) % 10}")
+        if i % per_dir == 0 or i % 20 == 0:
+            os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"f{i:06d}.{('class', 'dex', 'xml', 'json')[i % 4]}"), "wb") as f:
+            f.write(b"x")
+    stub_tool.write_outputs(android, "debug")
+
+
+def main_cli():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="1M,16M", help="project ZIP sizes, e.g. 1M,256M,2G")
+    ap.add_argument("--runs", type=int, default=5, help="samples for the pipeline phases")
+    ap.add_argument("--gradle-lines", type=int, default=2000, help="lines printed by each stub Gradle run")
+    ap.add_argument("--log-lines", type=int, default=200000)
+    ap.add_argument("--tree-files", type=int, default=20000)
+    ap.add_argument("--toolchain-mb", type=int, default=4, help="padding per toolchain archive")
+    ap.add_argument("--keep", action="store_true", help="keep the temporary work dir")
+    ap.add_argument("--update", action="store_true", help="write the measured overheads as the new baseline")
+    ap.add_argument("--slack", type=float, default=1.5, help="budget = overhead * slack when updating")
+    ap.add_argument("--min-slack", type=float, default=0.25, help="minimum budget headroom in seconds")
+    args = ap.parse_args()
+    args.sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    if platform.system() != "Linux":
+        print("the stub toolchain targets Linux")
+        return 1
+
+    results = run(args)
+
+    if args.update:
+        os.makedirs(os.path.dirname(BASELINE), exist_ok=True)
+        data = {
+            "python": platform.python_version(),
+            "platform": platform.system(),
+            "phases": {name: {"overhead_s": r["overhead_s"],
+                              "budget_s": round(max(r["overhead_s"] * args.slack, r["overhead_s"] + args.min_slack), 3)}
+                       for name, r in results.items()},
+        }
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"baseline written: {BASELINE}")
+        return 0
+
+    if not os.path.exists(BASELINE):
+        print("no baseline yet; run with --update")
+        return 0
+    with open(BASELINE, "r", encoding="utf-8") as f:
+        budgets = json.load(f)["phases"]
+    over = [name for name, r in results.items() if name in budgets and r["overhead_s"] > budgets[name]["budget_s"]]
+    for name in over:
+        print(f"OVER BUDGET: {name} overhead {results[name]['overhead_s']:.3f}s > {budgets[name]['budget_s']:.3f}s")
+    print("budget -> " + ("OK" if not over else f"{len(over)} phase(s) over budget"))
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stub Node.js / Cordova / npm / Gradle / Android SDK / JDK tools for the offline
+end-to-end benchmark (see bench_e2e.py).
+
+Every fake executable in the stub toolchain is a tiny launcher that imports this
+module and calls main("<tool>"). The stubs behave like the real tools as far as
+Saturn Builder can tell: they print output of a realistic shape and volume
+(SATURN_STUB_LINES lines per Gradle run), create the files the builder checks
+for (platforms/android, source.properties, APK/AAB with output-metadata.json)
+and answer the sdkmanager license prompt. They do no real work, so the time a
+build takes minus the time spent inside stubs is Python-side overhead.
+
+When SATURN_STUB_TIMES is set, each stub appends "<tool> <seconds>" (time from
+process start, interpreter start-up included, until its output is ready) to
+that file.
+"""
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import time
+import zipfile
+
+STUB_DIR = os.path.dirname(os.path.abspath(__file__))
+LINES = int(os.environ.get("SATURN_STUB_LINES", "2000"))
+_T0 = time.time()
+
+GRADLE_TASKS = [
+    "preBuild", "preDebugBuild", "compileDebugAidl", "generateDebugBuildConfig", "mergeDebugResources",
+    "processDebugManifest", "processDebugResources", "compileDebugJavaWithJavac", "mergeDebugAssets",
+    "compressDebugAssets", "dexBuilderDebug", "mergeDexDebug", "mergeDebugJniLibFolders", "packageDebug",
+    "createDebugApkListingFileRedirect", "assembleDebug",
+]
+WARNINGS = [
+    "warning: [options] source value 8 is obsolete and will be removed in a future release",
+    "Note: Some input files use or override a deprecated API.",
+    "Note: Recompile with -Xlint:deprecation for details.",
+    "w: /platforms/android/CordovaLib/src/org/apache/cordova/CordovaWebViewImpl.java: unchecked call",
+]
+
+
+def launcher(tool):
+    """Text of an executable that runs `tool` from this module."""
+    return (f"#!{sys.executable}\n"
+            "import sys\n"
+            f"sys.path.insert(0, {STUB_DIR!r})\n"
+            "import stub_tool\n"
+            f"sys.exit(stub_tool.main({tool!r}))\n")
+
+
+def write_launcher(path, tool):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(launcher(tool))
+    os.chmod(path, 0o755)
+
+
+def process_age():
+    """Seconds since this process started (Linux: /proc), so interpreter start-up is included."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return time.time() - _T0
+
+
+def emit_gradle(count):
+    out = sys.stdout
+    rnd = random.Random(count)
+    out.write("Starting a Gradle Daemon (subsequent builds will be faster)\n")
+    for i in range(count):
+        if i % 40 == 0:
+            out.write(f"> Task :app:{GRADLE_TASKS[(i // 40) % len(GRADLE_TASKS)]}\n")
+        elif i % 7 == 0:
+            out.write(f"> Task :CordovaLib:{GRADLE_TASKS[i % len(GRADLE_TASKS)]} UP-TO-DATE\n")
+        else:
+            out.write(rnd.choice(WARNINGS) + "\n")
+    out.write("\nBUILD SUCCESSFUL in 42s\n47 actionable tasks: 47 executed\n")
+    out.flush()
+
+
+def sync_www(project_dir, android_dir):
+    src = os.path.join(project_dir, "www")
+    dst = os.path.join(android_dir, "app", "src", "main", "assets", "www")
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+    os.makedirs(dst, exist_ok=True)
+    with open(os.path.join(dst, "cordova.js"), "w", encoding="utf-8") as f:
+        f.write("// cordova.js stub\n" * 200)
+    return dst
+
+
+def write_outputs(android_dir, variant, bundle=False):
+    """Fake Gradle outputs: an APK/AAB holding the platform www plus dex/resources."""
+    www = os.path.join(android_dir, "app", "src", "main", "assets", "www")
+    outputs = os.path.join(android_dir, "app", "build", "outputs")
+    if bundle:
+        out_dir = os.path.join(outputs, "bundle", variant)
+        name = f"app-{variant}.aab"
+        prefix = "base/assets/"
+    else:
+        out_dir = os.path.join(outputs, "apk", variant)
+        name = f"app-{variant}.apk" if variant == "debug" else f"app-{variant}-unsigned.apk"
+        prefix = "assets/"
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, name)
+    rnd = random.Random(7)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        zf.writestr("AndroidManifest.xml", "<manifest package='com.example.game'/>" * 20)
+        zf.writestr("classes.dex", bytes(rnd.getrandbits(8) for _ in range(256 * 1024)))
+        zf.writestr("resources.arsc", b"\0" * 64 * 1024, compress_type=zipfile.ZIP_STORED)
+        for folder, _dirs, files in os.walk(www):
+            for fname in files:
+                full = os.path.join(folder, fname)
+                rel = os.path.relpath(full, os.path.dirname(www)).replace(os.sep, "/")
+                zf.write(full, prefix + rel)
+    if not bundle:
+        meta = {"version": 3, "artifactType": {"type": "APK", "kind": "Directory"}, "variantName": variant,
+                "elements": [{"type": "SINGLE", "outputFile": name}]}
+        with open(os.path.join(out_dir, "output-metadata.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    return path
+
+
+def gradle(argv, cwd=None):
+    android_dir = cwd or os.getcwd()
+    tasks = [a for a in argv if not a.startswith("-") and not a.endswith(".gradle")]
+    if "clean" in tasks:
+        shutil.rmtree(os.path.join(android_dir, "app", "build"), ignore_errors=True)
+    build_tasks = [t for t in tasks if t != "clean"]
+    if not build_tasks:
+        return 0
+    emit_gradle(LINES)
+    for task in build_tasks:
+        if task == "bundleRelease":
+            write_outputs(android_dir, "release", bundle=True)
+        elif task.startswith("assemble"):
+            write_outputs(android_dir, "debug" if "Debug" in task else "release")
+    return 0
+
+
+def cordova(argv):
+    project_dir = os.getcwd()
+    android_dir = os.path.join(project_dir, "platforms", "android")
+    cmd = argv[0] if argv else ""
+    if cmd == "platform" and argv[1:2] == ["add"]:
+        print(f"Using cordova-fetch for {argv[2] if len(argv) > 2 else 'android'}")
+        print("Adding android project...")
+        os.makedirs(os.path.join(android_dir, "cordova"), exist_ok=True)
+        with open(os.path.join(android_dir, "cordova", "Api.js"), "w", encoding="utf-8") as f:
+            f.write("module.exports = {};\n")
+        os.makedirs(os.path.join(android_dir, "app"), exist_ok=True)
+        with open(os.path.join(android_dir, "app", "build.gradle"), "w", encoding="utf-8") as f:
+            f.write("apply plugin: 'com.android.application'\nandroid {\n}\n")
+        write_launcher(os.path.join(android_dir, "gradlew"), "gradle")
+        sync_www(project_dir, android_dir)
+        print("Android project created with cordova-android@12.0.0")
+        return 0
+    if cmd == "prepare":
+        sync_www(project_dir, android_dir)
+        return 0
+    if cmd == "clean":
+        shutil.rmtree(os.path.join(android_dir, "app", "build"), ignore_errors=True)
+        return 0
+    if cmd in ("build", "compile"):
+        if cmd == "build":
+            sync_www(project_dir, android_dir)
+        release = "--release" in argv
+        if "--packageType=bundle" in argv:
+            task = "bundleRelease"
+        else:
+            task = "assembleRelease" if release else "assembleDebug"
+        print(f"Checking Java JDK and Android SDK versions\nSubproject Path: CordovaLib\nRunning gradle task {task}")
+        gradle([task], android_dir)
+        return 0
+    return 0
+
+
+def npm(argv):
+    if not argv or argv[0] != "install":
+        return 0
+    prefix = os.getcwd()
+    if "--prefix" in argv:
+        prefix = argv[argv.index("--prefix") + 1]
+    for spec in argv[1:]:
+        if spec.startswith("-") or spec == prefix:
+            continue
+        name = spec.rsplit("@", 1)[0] if spec.count("@") and not spec.startswith("@") else spec
+        modules = os.path.join(prefix, "node_modules")
+        if name == "cordova":
+            os.makedirs(os.path.join(modules, "cordova", "bin"), exist_ok=True)
+            with open(os.path.join(modules, "cordova", "bin", "cordova"), "w", encoding="utf-8") as f:
+                f.write("#!/usr/bin/env node\n")
+        elif name == "terser":
+            os.makedirs(os.path.join(modules, "terser", "bin"), exist_ok=True)
+            with open(os.path.join(modules, "terser", "bin", "terser"), "w", encoding="utf-8") as f:
+                f.write("#!/usr/bin/env node\n")
+        else:
+            write_launcher(os.path.join(modules, ".bin", name), "noop")
+        for i in range(60):
+            print(f"npm http fetch GET 200 https://registry.npmjs.org/{name}-dep-{i} 12ms (cache hit)")
+        print("\nadded 213 packages in 3s")
+    return 0
+
+
+def node(argv):
+    if argv[:1] == ["--version"]:
+        print("v18.16.0")
+        return 0
+    script = argv[0] if argv else ""
+    if script.endswith("npm-cli.js"):
+        return npm(argv[1:])
+    if script.endswith(os.path.join("cordova", "bin", "cordova")):
+        return cordova(argv[1:])
+    if script.endswith(os.path.join("terser", "bin", "terser")):
+        sys.stdout.write(sys.stdin.read())
+        return 0
+    return 0
+
+
+def sdkmanager(argv):
+    sdk_root = next((a.split("=", 1)[1] for a in argv if a.startswith("--sdk_root=")), None)
+    if "--licenses" in argv:
+        for i in range(3):
+            sys.stdout.write(f"License android-sdk-license-{i}:\n---------------------------------------\n"
+                             "Terms and Conditions\n---------------------------------------\n"
+                             "Accept? (y/N): ")
+            sys.stdout.flush()
+            sys.stdin.readline()
+        print("All SDK package licenses accepted")
+        return 0
+    packages = [a for a in argv if not a.startswith("-")]
+    for pct in range(0, 101, 5):
+        print(f"[{'=' * (pct // 3):<33}] {pct}% Downloading {packages[0] if packages else ''}...")
+    for package in packages:
+        parts = package.split(";")
+        target = os.path.join(sdk_root, *parts)
+        os.makedirs(target, exist_ok=True)
+        revision = parts[1] if parts[0] in ("build-tools", "cmake", "ndk") and len(parts) > 1 else "34.0.0"
+        with open(os.path.join(target, "source.properties"), "w", encoding="utf-8") as f:
+            f.write(f"Pkg.Desc = {package}\nPkg.Revision={revision}\n")
+        if parts[0] == "build-tools":
+            write_launcher(os.path.join(target, "zipalign"), "zipalign")
+            write_launcher(os.path.join(target, "apksigner"), "apksigner")
+        elif parts[0] == "platform-tools":
+            write_launcher(os.path.join(target, "adb"), "noop")
+    print("[=================================] 100% Unzipping... done")
+    return 0
+
+
+def zipalign(argv):
+    files = [a for a in argv if not a.startswith("-") and not a.isdigit()]
+    if "-c" not in argv and len(files) >= 2:
+        shutil.copyfile(files[-2], files[-1])
+    return 0
+
+
+def apksigner(argv):
+    if argv[:1] == ["sign"]:
+        print("Signed")
+    return 0
+
+
+def java(argv):
+    sys.stderr.write('openjdk version "17.0.2" 2022-01-18\nOpenJDK Runtime Environment Temurin-17.0.2+8\n')
+    return 0
+
+
+def keytool(argv):
+    if "-genkey" in argv or "-genkeypair" in argv:
+        path = argv[argv.index("-keystore") + 1]
+        with open(path, "wb") as f:
+            f.write(os.urandom(2048))
+        print("Generating 2,048 bit RSA key pair and self-signed certificate (SHA256withRSA)")
+        return 0
+    if "-list" in argv:
+        print("Alias name: " + (argv[argv.index("-alias") + 1] if "-alias" in argv else "key"))
+    return 0
+
+
+def emit(argv):
+    """Raw output generator for the log-throughput phase."""
+    emit_gradle(int(argv[0]) if argv else LINES)
+    return 0
+
+
+TOOLS = {
+    "node": node, "gradle": gradle, "sdkmanager": sdkmanager, "zipalign": zipalign, "apksigner": apksigner,
+    "java": java, "keytool": keytool, "emit": emit, "noop": lambda argv: 0,
+}
+
+
+def main(tool):
+    """Runs a stub. Output is buffered and written only after the elapsed time is taken:
+    time the builder spends draining the pipe is then counted as builder overhead,
+    not as stub time. The sdkmanager license prompt stays interactive."""
+    interactive = tool == "sdkmanager" and "--licenses" in sys.argv
+    real_stdout = sys.stdout
+    if not interactive:
+        sys.stdout = io.StringIO()
+    rc = 1
+    try:
+        rc = TOOLS[tool](sys.argv[1:])
+    finally:
+        elapsed = process_age()
+        if not interactive:
+            real_stdout.write(sys.stdout.getvalue())
+            real_stdout.flush()
+            sys.stdout = real_stdout
+        times = os.environ.get("SATURN_STUB_TIMES")
+        if times:
+            with open(times, "a", encoding="utf-8") as f:
+                f.write(f"{tool} {elapsed:.4f}\n")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.argv = sys.argv[1:]
+    sys.exit(main(sys.argv[0]))
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Fixtures for the offline end-to-end benchmark (see bench_e2e.py).
+
+- build_archives(): fake Node.js / JDK / Gradle / cmdline-tools archives with the
+  same layout as the real downloads (so _flatten_dir/_fix_sdk_structure do their
+  usual work), whose executables are stub_tool launchers;
+- ArchiveServer: serves them from 127.0.0.1 on a random port;
+- write_manifest(): dependencies/toolchains.json pointing the default toolchain
+  URLs at that server;
+- make_c3_project_zip(): a Construct 3 style Cordova export of a given size.
+"""
+import http.server
+import io
+import os
+import random
+import tarfile
+import threading
+import zipfile
+
+import stub_tool
+
+CHUNK = 1024 * 1024
+# Доли проекта по типам файлов: примерно как в экспорте Construct 3 с медиа
+C3_MIX = (
+    ("media", ".webm", 0.45),
+    ("media", ".ogg", 0.15),
+    ("images", ".webp", 0.30),
+    ("scripts", ".js", 0.06),
+    ("", ".json", 0.04),
+)
+CONFIG_XML = """<?xml version='1.0' encoding='utf-8'?>
+<widget id="com.example.{name}" version="1.0.0" xmlns="http://www.w3.org/ns/widgets" xmlns:cdv="http://cordova.apache.org/ns/1.0">
+    <name>{name}</name>
+    <description>Construct 3 game</description>
+    <author email="dev@example.com" href="https://example.com">Example</author>
+    <content src="index.html" />
+    <access origin="*" />
+    <allow-intent href="http://*/*" />
+    <allow-intent href="https://*/*" />
+    <preference name="Orientation" value="landscape" />
+    <preference name="Fullscreen" value="true" />
+    <preference name="android-minSdkVersion" value="24" />
+    <preference name="android-targetSdkVersion" value="34" />
+    <platform name="android">
+        <allow-intent href="market:*" />
+        <icon density="xxxhdpi" src="www/icons/icon-512.png" />
+    </platform>
+</widget>
+"""
+
+
+def _random_blob(size, seed=0):
+    """Несжимаемый блок: медиа и изображения в реальных экспортах уже сжаты."""
+    return random.Random(seed).randbytes(size)
+
+
+def _tar_add(tar, name, data, mode=0o644):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _zip_add(zf, name, data, mode=0o644):
+    info = zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0))
+    info.external_attr = (0o100000 | mode) << 16
+    info.compress_type = zipfile.ZIP_DEFLATED
+    zf.writestr(info, data)
+
+
+def build_archives(out_dir, versions, padding_mb=4):
+    """Архивы инструментов в out_dir; возвращает {tool: имя файла}."""
+    os.makedirs(out_dir, exist_ok=True)
+    pad = _random_blob(padding_mb * CHUNK, seed=1)
+    names = {}
+
+    node_root = f"node-v{versions['node']}-linux-x64"
+    names["node"] = node_root + ".tar.xz"
+    with tarfile.open(os.path.join(out_dir, names["node"]), "w:xz", preset=0) as tar:
+        _tar_add(tar, f"{node_root}/bin/node", stub_tool.launcher("node").encode(), 0o755)
+        _tar_add(tar, f"{node_root}/lib/node_modules/npm/bin/npm-cli.js", b"// npm stub\n")
+        _tar_add(tar, f"{node_root}/lib/libnode.pad", pad)
+
+    jdk_version = versions["jdk"]
+    jdk_root = f"jdk-{jdk_version}"
+    names["jdk"] = f"OpenJDK{jdk_version.split('.')[0]}U-jdk_x64_linux_hotspot_{jdk_version.replace('+', '_')}.tar.gz"
+    with tarfile.open(os.path.join(out_dir, names["jdk"]), "w:gz", compresslevel=1) as tar:
+        for tool in ("java", "keytool"):
+            _tar_add(tar, f"{jdk_root}/bin/{tool}", stub_tool.launcher(tool).encode(), 0o755)
+        _tar_add(tar, f"{jdk_root}/lib/modules", pad)
+
+    gradle_root = f"gradle-{versions['gradle']}"
+    names["gradle"] = gradle_root + "-bin.zip"
+    with zipfile.ZipFile(os.path.join(out_dir, names["gradle"]), "w", compresslevel=1) as zf:
+        _zip_add(zf, f"{gradle_root}/bin/gradle", stub_tool.launcher("gradle"), 0o755)
+        _zip_add(zf, f"{gradle_root}/lib/gradle-launcher.jar", pad)
+
+    names["cmdline-tools"] = f"commandlinetools-linux-{versions['cmdline-tools']}_latest.zip"
+    with zipfile.ZipFile(os.path.join(out_dir, names["cmdline-tools"]), "w", compresslevel=1) as zf:
+        _zip_add(zf, "cmdline-tools/bin/sdkmanager", stub_tool.launcher("sdkmanager"), 0o755)
+        _zip_add(zf, "cmdline-tools/lib/sdklib.jar", pad[:len(pad) // 2])
+    return names
+
+
+def write_manifest(dep_dir, base_url, names):
+    """dependencies/toolchains.json: URL набора по умолчанию указывают на локальный сервер."""
+    import json
+    os.makedirs(dep_dir, exist_ok=True)
+    manifest = {"urls": {tool: {"default": f"{base_url}/{name}"} for tool, name in names.items()}}
+    with open(os.path.join(dep_dir, "toolchains.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class ArchiveServer:
+    """HTTP-сервер архивов инструментов на 127.0.0.1 (порт выбирается системой)."""
+    def __init__(self, directory):
+        handler = lambda *a, **kw: _QuietHandler(*a, directory=directory, **kw)
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _write_stream(zf, name, size, blob, compress):
+    info = zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zf.open(info, "w", force_zip64=size > 0x7FFFFFFF) as f:
+        left = size
+        while left > 0:
+            n = min(left, len(blob))
+            f.write(blob[:n])
+            left -= n
+
+
+def make_c3_project_zip(path, size, name="game"):
+    """Экспорт Construct 3 для Cordova размером около size байт.
+
+    Структура: <name>/config.xml и <name>/www (index.html, c3runtime.js, data.json,
+    scripts/, images/*.webp, media/*.webm|ogg). Медиа и изображения записываются
+    без сжатия, как их и экспортирует Construct 3; текстовые файлы сжимаются.
+    Возвращает число файлов в www.
+    """
+    blob = _random_blob(CHUNK, seed=2)
+    text = ("function c3_runtime_tick(t){for(var i=0;i<t.length;i++){t[i].update(t[i].dt)}}\n" * 16384).encode()
+    root = f"{name}/"
+    files = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1) as zf:
+        zf.writestr(root + "config.xml", CONFIG_XML.format(name=name))
+        zf.writestr(root + "package.json", '{"name": "%s", "version": "1.0.0", "cordova": {"platforms": ["android"]}}' % name)
+        zf.writestr(root + "www/index.html", "<!DOCTYPE html><html><head><script src='c3runtime.js'></script></head><body></body></html>")
+        zf.writestr(root + "www/c3runtime.js", text[:min(len(text), max(4096, size // 50))])
+        files += 2
+        for folder, ext, share in C3_MIX:
+            budget = int(size * share)
+            # Файлы по 64 КБ .. 8 МБ: много мелких в маленьких проектах, крупные в больших
+            per_file = max(64 * 1024, min(8 * CHUNK, budget // 64 or 1))
+            index = 0
+            while budget > 0:
+                chunk = min(per_file, budget)
+                sub = f"{folder}/" if folder else ""
+                entry = f"{root}www/{sub}{'data' if ext == '.json' else 'asset'}{index:05d}{ext}"
+                if ext in (".js", ".json"):
+                    _write_stream(zf, entry, chunk, text, compress=True)
+                else:
+                    _write_stream(zf, entry, chunk, blob, compress=False)
+                budget -= chunk
+                index += 1
+                files += 1
+    return files
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup-time budget for Saturn Builder.
+
+Runs `python -X importtime -c "import main"` in fresh interpreters, takes the
+median cumulative import time of the `main` module and compares it with the
+budget stored in benchmarks/baselines/startup.json. One unmeasured run first
+writes the bytecode cache (PYTHONDONTWRITEBYTECODE is ignored), so the numbers
+are those of a normal start and not of compiling main.py.
+
+Usage:
+    python benchmarks/startup_importtime.py              # check against budget
+    python benchmarks/startup_importtime.py --runs 15    # more samples
+    python benchmarks/startup_importtime.py --update     # store a new baseline
+
+Exit code is 1 when the median exceeds the budget, so the script can gate CI.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "startup.json")
+# Modules that must never be imported while `main` is imported (they are loaded on first use).
+# Pillow is not listed: customtkinter itself imports it for CTkImage.
+DEFERRED_MODULES = ("requests", "pyperclip", "psutil", "pip")
+
+
+def sample(python):
+    """Return {module: (self_us, cumulative_us)} for one cold interpreter."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{proc.stderr[-2000:]}")
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        modules[parts[2].strip()] = (self_us, cum_us)
+    return modules
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--python", default=sys.executable)
+    ap.add_argument("--update", action="store_true", help="write the measured median as the new baseline")
+    ap.add_argument("--slack", type=float, default=1.5, help="budget = baseline * slack when updating")
+    args = ap.parse_args()
+
+    sample(args.python)  # warm-up: writes .pyc files for main and its imports
+    runs = [sample(args.python) for _ in range(max(1, args.runs))]
+    totals = [r["main"][1] for r in runs if "main" in r]
+    own = [r["main"][0] for r in runs if "main" in r]
+    median_total = int(statistics.median(totals))
+    median_own = int(statistics.median(own))
+
+    # Aggregate self time per top-level package for the report
+    per_pkg = {}
+    for name, (self_us, _) in runs[-1].items():
+        pkg = name.split(".")[0]
+        per_pkg[pkg] = per_pkg.get(pkg, 0) + self_us
+    top = sorted(per_pkg.items(), key=lambda kv: kv[1], reverse=True)[:10]
+
+    leaked = sorted({name.split(".")[0] for r in runs for name in r if name.split(".")[0] in DEFERRED_MODULES})
+
+    print(f"import main: median {median_total / 1000:.1f} ms total, {median_own / 1000:.1f} ms own ({len(totals)} runs)")
+    print("top packages by self time (last run):")
+    for pkg, us in top:
+        print(f"  {pkg:<28} {us / 1000:8.1f} ms")
+    if leaked:
+        print(f"FAIL: deferred modules imported at startup: {', '.join(leaked)}")
+
+    if args.update:
+        os.makedirs(os.path.dirname(BASELINE), exist_ok=True)
+        data = {
+            "python": platform.python_version(),
+            "platform": platform.system(),
+            "main_cumulative_us": median_total,
+            "main_own_us": median_own,
+            "budget_us": int(median_total * args.slack),
+        }
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"baseline written: {BASELINE}")
+        return 1 if leaked else 0
+
+    if not os.path.exists(BASELINE):
+        print("no baseline yet; run with --update")
+        return 1 if leaked else 0
+    with open(BASELINE, "r", encoding="utf-8") as f:
+        budget = json.load(f)["budget_us"]
+    ok = median_total <= budget and not leaked
+    print(f"budget {budget / 1000:.1f} ms -> {'OK' if ok else 'OVER BUDGET'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())